@@ -1,3 +1,43 @@
-from .marketplace import scrape_marketplace_cars
+from typing import TYPE_CHECKING
 
-__all__ = ["scrape_marketplace_cars"]
+# Resolved lazily (PEP 562) so `python -m scraper.cli --help` does not import Playwright.
+_EXPORTS = {
+    "Cluster": ".cluster",
+    "close_browser": "._browser_pool",
+    "iter_marketplace_cars": ".marketplace",
+    "iter_marketplace_cars_many": ".marketplace",
+    "scrape_marketplace_cars": ".marketplace",
+    "scrape_marketplace_cars_many": ".marketplace",
+    "stream_marketplace_cars_many": ".marketplace",
+}
+
+if TYPE_CHECKING:
+    from ._browser_pool import close_browser
+    from .cluster import Cluster
+    from .marketplace import (
+        iter_marketplace_cars,
+        iter_marketplace_cars_many,
+        scrape_marketplace_cars,
+        scrape_marketplace_cars_many,
+        stream_marketplace_cars_many,
+    )
+
+__all__ = [
+    "Cluster",
+    "close_browser",
+    "iter_marketplace_cars",
+    "iter_marketplace_cars_many",
+    "scrape_marketplace_cars",
+    "scrape_marketplace_cars_many",
+    "stream_marketplace_cars_many",
+]
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        from importlib import import_module
+
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import asyncio
+import atexit
+import warnings
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+from playwright.async_api import Error as PlaywrightError
+
+
+_BROWSER_ARGS = [
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+]
+
+_pw: Optional[Playwright] = None
+_browser: Optional[Browser] = None
+_persistent: Dict[str, BrowserContext] = {}
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_lock: Optional[asyncio.Lock] = None
+_guard: Optional[asyncio.Task] = None
+
+
+async def _shutdown(
+    pw: Optional[Playwright],
+    browser: Optional[Browser],
+    contexts: List[BrowserContext],
+    guard: Optional[asyncio.Task] = None,
+) -> None:
+    if guard is not None and guard is not asyncio.current_task():
+        guard.cancel()
+        await asyncio.gather(guard, return_exceptions=True)
+    for ctx in contexts:
+        try:
+            await ctx.close()
+        except Exception:
+            pass
+    try:
+        if browser is not None:
+            await browser.close()
+    except Exception:
+        pass
+    try:
+        if pw is not None:
+            await pw.stop()
+    except Exception:
+        pass
+
+
+def _reset_loop_state() -> asyncio.Lock:
+    # Playwright objects are bound to the loop that created them, so each event loop
+    # gets its own driver. asyncio.run() closes its browser through the guard task;
+    # any other loop must await close_browser() before it is abandoned.
+    global _pw, _browser, _loop, _lock, _guard
+    loop = asyncio.get_running_loop()
+    if _loop is not loop:
+        if _pw is not None:
+            warnings.warn(
+                "Dropping a Playwright browser left open by a previous event loop; "
+                "await scraper.close_browser() before that loop ends.",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+        _pw = None
+        _browser = None
+        _persistent.clear()
+        _guard = None
+        _lock = asyncio.Lock()
+        _loop = loop
+    return _lock
+
+
+async def _close_on_loop_shutdown() -> None:
+    # asyncio.run() cancels leftover tasks before closing its loop, so this task's
+    # cancellation is the last point at which the shared browser can still be closed.
+    loop = asyncio.get_running_loop()
+    try:
+        await loop.create_future()
+    finally:
+        if _loop is loop:
+            await close_browser()
+
+
+def _ensure_guard() -> None:
+    global _guard
+    if _guard is None:
+        _guard = asyncio.get_running_loop().create_task(_close_on_loop_shutdown())
+
+
+def _profile_is_locked(profile: Path, exc: PlaywrightError) -> bool:
+    # Chromium locks a profile to one browser process at a time through a
+    # SingletonLock symlink (a dangling link, hence is_symlink()).
+    lock = profile / "SingletonLock"
+    if lock.is_symlink() or lock.exists():
+        return True
+    message = str(exc)
+    return "ProcessSingleton" in message or "profile appears to be in use" in message
+
+
+async def get_browser(*, headless: bool = True, slow_mo_ms: int = 0) -> Browser:
+    """Return the shared Chromium instance, launching it on first use.
+
+    Launch options only apply to the first call; later callers reuse the running
+    browser and isolate themselves with their own ``BrowserContext``.
+    """
+    global _pw, _browser
+    lock = _reset_loop_state()
+    async with lock:
+        if _browser is None or not _browser.is_connected():
+            _pw = _pw or await async_playwright().start()
+            _browser = await _pw.chromium.launch(
+                headless=headless,
+                slow_mo=slow_mo_ms,
+                args=_BROWSER_ARGS,
+                handle_sigint=False,
+                handle_sigterm=False,
+                handle_sighup=False,
+            )
+            _ensure_guard()
+    return _browser
+
+
+def _evict_when_closed(key: str, ctx: BrowserContext) -> None:
+    def evict(_: BrowserContext) -> None:
+        if _persistent.get(key) is ctx:
+            del _persistent[key]
+
+    ctx.on("close", evict)
+
+
+async def get_persistent_context(
+    user_data_dir: str,
+    *,
+    headless: bool = True,
+    slow_mo_ms: int = 0,
+    user_agent: str,
+    viewport: Dict[str, int],
+    on_new_profile: Optional[Callable[[BrowserContext], Awaitable[None]]] = None,
+) -> BrowserContext:
+    """Return the shared context backed by the Chromium profile at ``user_data_dir``.
+
+    Cookies, caches and the logged-in session survive between runs. ``on_new_profile``
+    runs once, before any caller sees the context, when the profile directory was empty.
+    A context that closes (e.g. its window is shut in headed mode) is relaunched on the
+    next call.
+    """
+    global _pw
+    lock = _reset_loop_state()
+    key = str(Path(user_data_dir).expanduser().resolve())
+    async with lock:
+        ctx = _persistent.get(key)
+        if ctx is None:
+            profile = Path(key)
+            is_new = not profile.exists() or not any(profile.iterdir())
+            profile.mkdir(parents=True, exist_ok=True)
+            _pw = _pw or await async_playwright().start()
+            try:
+                ctx = await _pw.chromium.launch_persistent_context(
+                    key,
+                    headless=headless,
+                    slow_mo=slow_mo_ms,
+                    user_agent=user_agent,
+                    viewport=viewport,
+                    args=_BROWSER_ARGS,
+                    handle_sigint=False,
+                    handle_sigterm=False,
+                    handle_sighup=False,
+                )
+            except PlaywrightError as exc:
+                if not _profile_is_locked(profile, exc):
+                    raise
+                raise RuntimeError(
+                    f"Chromium profile at {key} is in use by another browser ({exc.message}). "
+                    "Use a throwaway profile (--ephemeral / user_data_dir=None) or a different "
+                    "--user-data-dir."
+                ) from exc
+            _ensure_guard()
+            _evict_when_closed(key, ctx)
+            if is_new and on_new_profile is not None:
+                await on_new_profile(ctx)
+            _persistent[key] = ctx
+    return ctx
+
+
+async def close_browser() -> None:
+    """Shut down the shared browser, persistent profiles and Playwright driver.
+
+    Safe to call more than once; the next scrape launches a fresh browser. Async
+    callers should await this before their event loop ends.
+    """
+    global _pw, _browser, _guard
+    browser, pw = _browser, _pw
+    contexts = list(_persistent.values())
+    guard = _guard
+    _browser = None
+    _pw = None
+    _guard = None
+    _persistent.clear()
+    await _shutdown(pw, browser, contexts, guard)
+
+
+def _close_browser_at_exit() -> None:
+    # Only possible while the owning loop is still open and idle; asyncio.run() callers
+    # are covered by the guard task instead.
+    if _pw is None or _loop is None or _loop.is_closed() or _loop.is_running():
+        return
+    _loop.run_until_complete(close_browser())
+
+
+atexit.register(_close_browser_at_exit)
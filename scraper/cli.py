@@ -1,63 +1,193 @@
+# Heavy imports (the scraper and Playwright, csv, orjson) are deferred to where they
+# are used so that --help and argument errors return immediately.
 import argparse
-import json
-import csv
+import sys
+from contextlib import ExitStack
 from pathlib import Path
-from typing import List, Dict
+from typing import Callable, Iterable, List, Dict, Tuple
 
-from .marketplace import scrape_marketplace_cars
+RowSink = Callable[[Dict], None]
+Flush = Callable[[], None]
 
 
 def write_json(path: Path, rows: List[Dict]) -> None:
+    import orjson
+
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(rows, f, ensure_ascii=False, indent=2)
+    path.write_bytes(orjson.dumps(rows, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+
 
+def _open_ndjson_sink(stack: ExitStack, path: Path) -> Tuple[RowSink, Flush]:
+    import orjson
 
-def write_csv(path: Path, rows: List[Dict]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    if not rows:
-        with path.open("w", newline="", encoding="utf-8") as f:
-            f.write("")
-        return
-    fieldnames = list(rows[0].keys())
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+    f = stack.enter_context(path.open("wb"))
+
+    def write(row: Dict) -> None:
+        f.write(orjson.dumps(row) + b"\n")
+
+    return write, f.flush
+
+
+def _open_stdout_json_sink(stack: ExitStack) -> Tuple[RowSink, Flush]:
+    # Streams the same bytes as orjson.dumps(rows) without holding the rows.
+    import orjson
+
+    out = sys.stdout.buffer
+    out.write(b"[")
+    first = True
+
+    def write(row: Dict) -> None:
+        nonlocal first
+        out.write(orjson.dumps(row) if first else b"," + orjson.dumps(row))
+        first = False
+
+    def close() -> None:
+        out.write(b"]\n")
+        out.flush()
+
+    stack.callback(close)
+    return write, out.flush
+
+
+def _open_csv_sink(stack: ExitStack, path: Path) -> Tuple[RowSink, Flush]:
+    # The header comes from the first row; no rows leaves an empty file.
+    import csv
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    f = stack.enter_context(path.open("w", newline="", encoding="utf-8", buffering=1 << 20))
+    writer = csv.writer(f)
+    fieldnames: List[str] = []
+
+    def write(row: Dict) -> None:
+        if not fieldnames:
+            fieldnames.extend(row.keys())
+            writer.writerow(fieldnames)
+        writer.writerow([row[k] for k in fieldnames])
+
+    return write, f.flush
+
+
+def write_ndjson(path: Path, rows: Iterable[Dict]) -> None:
+    with ExitStack() as stack:
+        write, _ = _open_ndjson_sink(stack, path)
+        for row in rows:
+            write(row)
+
+
+def write_csv(path: Path, rows: Iterable[Dict]) -> None:
+    with ExitStack() as stack:
+        write, _ = _open_csv_sink(stack, path)
         for row in rows:
-            writer.writerow(row)
+            write(row)
+
+
+def read_queries(path: Path) -> List[str]:
+    """Read one query per line, skipping blank lines and ``#`` comments."""
+    queries = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            queries.append(line)
+    return queries
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Scrape Facebook Marketplace car listings using Playwright. Requires login cookies.",
     )
-    parser.add_argument("--query", required=True, help="Search query, e.g., 'Toyota Camry 2018' ")
-    parser.add_argument("--max-items", type=int, default=50, help="Maximum number of listings to return")
+    parser.add_argument(
+        "--query",
+        action="append",
+        default=[],
+        help="Search query, e.g., 'Toyota Camry 2018'. Repeat to run several queries concurrently",
+    )
+    parser.add_argument("--batch-file", type=str, default=None, help="File with one search query per line")
+    parser.add_argument("--max-items", type=int, default=50, help="Maximum number of listings per query")
+    parser.add_argument(
+        "--location-contains",
+        action="append",
+        default=None,
+        help="Keep only listings whose card text contains this substring (case-insensitive). Repeatable",
+    )
+    parser.add_argument("--concurrency", type=int, default=5, help="Maximum number of queries scraped at once")
     parser.add_argument("--cookies", type=str, default=None, help="Path to cookies JSON exported from your browser")
+    parser.add_argument(
+        "--user-data-dir",
+        type=str,
+        default=None,
+        help="Chromium profile directory reused across runs (keeps the logged-in session). "
+        "Default: ~/.cache/car_sales/chrome",
+    )
+    parser.add_argument("--ephemeral", action="store_true", help="Use a throwaway browser profile for this run")
     parser.add_argument("--headless", action=argparse.BooleanOptionalAction, default=True, help="Run headless")
     parser.add_argument("--slow-mo-ms", type=int, default=0, help="Slow motion in milliseconds (debug)")
     parser.add_argument("--out-json", type=str, default=None, help="Write results to JSON at this path")
+    parser.add_argument("--out-ndjson", type=str, default=None, help="Write results as newline-delimited JSON at this path")
     parser.add_argument("--out-csv", type=str, default=None, help="Write results to CSV at this path")
     parser.add_argument("--save-cookies", type=str, default=None, help="Save session cookies to this file after run")
 
     args = parser.parse_args()
+    queries = list(args.query)
+    if args.batch_file:
+        queries.extend(read_queries(Path(args.batch_file)))
+    if not queries:
+        parser.error("at least one --query or a non-empty --batch-file is required")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
 
-    rows = scrape_marketplace_cars(
-        query=args.query,
-        max_items=args.max_items,
-        cookies_path=args.cookies,
-        headless=bool(args.headless),
-        slow_mo_ms=args.slow_mo_ms,
-        save_cookies_to=args.save_cookies,
-    )
+    from .marketplace import DEFAULT_USER_DATA_DIR, stream_marketplace_cars_many
+
+    if args.ephemeral:
+        user_data_dir = None
+    else:
+        user_data_dir = args.user_data_dir or DEFAULT_USER_DATA_DIR
+
+    failed: List[str] = []
+
+    def report_failure(query: str, exc: Exception) -> None:
+        # One bad query should not cost the rest of a batch its results.
+        failed.append(query)
+        print(f"query {query!r} failed: {exc}", file=sys.stderr)
+
+    rows: List[Dict] = []
+    with ExitStack() as stack:
+        # Compact JSON always goes to stdout. Streamed outputs are written as listings
+        # arrive and flushed after each scroll tick; only --out-json needs the full list.
+        sinks = [_open_stdout_json_sink(stack)]
+        if args.out_ndjson:
+            sinks.append(_open_ndjson_sink(stack, Path(args.out_ndjson)))
+        if args.out_csv:
+            sinks.append(_open_csv_sink(stack, Path(args.out_csv)))
+        writers = [write for write, _ in sinks]
+        if args.out_json:
+            writers.append(rows.append)
+
+        def flush_sinks() -> None:
+            for _, flush in sinks:
+                flush()
+
+        for row in stream_marketplace_cars_many(
+            queries=queries,
+            max_concurrency=args.concurrency,
+            max_items=args.max_items,
+            cookies_path=args.cookies,
+            headless=bool(args.headless),
+            slow_mo_ms=args.slow_mo_ms,
+            save_cookies_to=args.save_cookies,
+            user_data_dir=user_data_dir,
+            location_contains=args.location_contains,
+            on_error=report_failure,
+            on_idle=flush_sinks,
+        ):
+            for write in writers:
+                write(row)
 
     if args.out_json:
         write_json(Path(args.out_json), rows)
-    if args.out_csv:
-        write_csv(Path(args.out_csv), rows)
 
-    # Always print compact JSON to stdout
-    print(json.dumps(rows, ensure_ascii=False))
+    if failed:
+        sys.exit(f"{len(failed)} of {len(queries)} queries failed")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, List, Optional, TypeVar
+
+
+T = TypeVar("T")
+A = TypeVar("A")
+
+_TASK_DONE = object()
+
+
+class _TaskFailure:
+    # Wraps a task's exception so it cannot be mistaken for a yielded value.
+    def __init__(self, item: Any, exc: Exception) -> None:
+        self.item = item
+        self.exc = exc
+
+
+class Cluster:
+    """Bounded task pool over the shared browser, after puppeteer-cluster.
+
+    At most ``max_concurrency`` tasks run at once. Each task opens its own page (and,
+    without a persistent profile, its own ``BrowserContext``), so tasks only share
+    the Chromium process.
+    """
+
+    def __init__(self, max_concurrency: int = 5) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.sem = asyncio.Semaphore(max_concurrency)
+
+    async def task(self, fn: Callable[..., Awaitable[T]], *args: Any) -> T:
+        async with self.sem:
+            return await fn(*args)
+
+    async def map(
+        self,
+        fn: Callable[[A], Awaitable[T]],
+        items: Iterable[A],
+        on_error: Optional[Callable[[A, Exception], None]] = None,
+    ) -> List[Optional[T]]:
+        """Run ``fn`` over ``items`` and return the results in input order.
+
+        A task that raises is reported to ``on_error(item, exc)`` and its result is
+        None; without ``on_error`` the first exception is re-raised. Either way no task
+        is still running when this returns.
+        """
+        items = list(items)
+        tasks = [asyncio.ensure_future(self.task(fn, item)) for item in items]
+        try:
+            if on_error is None:
+                return list(await asyncio.gather(*tasks))
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        out: List[Optional[T]] = []
+        for item, result in zip(items, results):
+            if isinstance(result, Exception):
+                on_error(item, result)
+                out.append(None)
+            else:
+                out.append(result)
+        return out
+
+    async def stream(
+        self,
+        fn: Callable[[A], AsyncIterator[T]],
+        items: Iterable[A],
+        on_error: Optional[Callable[[A, Exception], None]] = None,
+        on_idle: Optional[Callable[[], None]] = None,
+    ) -> AsyncIterator[T]:
+        """Yield what each ``fn(item)`` yields, interleaved in arrival order.
+
+        A task that raises is reported to ``on_error(item, exc)`` and the others keep
+        running; without ``on_error`` the first exception is re-raised here. Remaining
+        tasks are cancelled when the consumer stops iterating. ``on_idle()`` is called
+        whenever everything produced so far has been consumed and the stream is about
+        to wait for more, e.g. to flush output once per burst instead of once per value.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def _drain(item: A) -> None:
+            try:
+                async with self.sem:
+                    async for value in fn(item):
+                        queue.put_nowait(value)
+            except Exception as exc:
+                queue.put_nowait(_TaskFailure(item, exc))
+            finally:
+                queue.put_nowait(_TASK_DONE)
+
+        tasks = [asyncio.create_task(_drain(item)) for item in items]
+        try:
+            remaining = len(tasks)
+            pending = False
+            while remaining:
+                if pending and on_idle is not None and queue.empty():
+                    on_idle()
+                    pending = False
+                value = await queue.get()
+                if value is _TASK_DONE:
+                    remaining -= 1
+                elif isinstance(value, _TaskFailure):
+                    if on_error is None:
+                        raise value.exc
+                    on_error(value.item, value.exc)
+                else:
+                    yield value
+                    pending = True
+        finally:
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
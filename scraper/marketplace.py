@@ -4,21 +4,43 @@ import asyncio
 import json
 import os
 import re
+import sys
 import time
-from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
-from typing import Dict, Iterable, List, Optional, Set
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional, Set, Tuple, TypedDict
+from urllib.parse import urlparse
 
-from tenacity import retry, stop_after_attempt, wait_fixed
-from pyppeteer import launch
+from playwright.async_api import Error as PlaywrightError
+
+from ._browser_pool import close_browser, get_browser, get_persistent_context
+from .cluster import Cluster
 
 
 FACEBOOK_MARKETPLACE_SEARCH = "https://www.facebook.com/marketplace/search/?query={query}"
 FACEBOOK_MARKETPLACE_HOME = "https://www.facebook.com/marketplace/"
 
+# Chromium profile reused across runs; pass user_data_dir=None for a throwaway context.
+DEFAULT_USER_DATA_DIR = os.path.join(os.path.expanduser("~"), ".cache", "car_sales", "chrome")
+
+# Listing data comes from anchors and their text; img src attributes are set by
+# the page scripts, so image, media, font and stylesheet bytes are never needed.
+# Blocked by URL in the browser (CDP) rather than through page.route(): routing
+# disables the HTTP cache and sends every request through Python.
+_BLOCKED_URL_PATTERNS = [
+    f"*.{ext}*"
+    for ext in (
+        "jpg", "jpeg", "png", "gif", "webp", "avif", "svg", "ico",
+        "mp4", "webm", "m4a", "mp3",
+        "woff", "woff2", "ttf", "otf",
+        "css",
+    )
+]
+
+_ITEM_ID_RE = re.compile(r"/marketplace/item/(\d+)")
+_PRICE_TOKENS = ("$", "€", "£", "CAD", "AUD", "₹", "Price")
+
 
-@dataclass
-class Listing:
+class Listing(TypedDict):
     item_id: str
     url: str
     title: str
@@ -26,6 +48,7 @@ class Listing:
     location_text: str
     image_url: str
     scraped_at: str
+    query: str
 
 
 def _now_iso() -> str:
@@ -33,8 +56,9 @@ def _now_iso() -> str:
 
 
 def _extract_item_id_from_url(url: str) -> Optional[str]:
-    match = re.search(r"/marketplace/item/(\d+)", url)
-    return match.group(1) if match else None
+    match = _ITEM_ID_RE.search(url)
+    # Interned so the per-scrape seen-set compares repeated ids by identity.
+    return sys.intern(match.group(1)) if match else None
 
 
 def _default_user_agent() -> str:
@@ -55,72 +79,145 @@ def _load_cookies_from_file(cookies_path: str) -> List[Dict]:
 
 
 async def _save_cookies_to_file(page, cookies_path: str) -> None:
-    cookies = await page.cookies()
+    cookies = await page.context.cookies()
     with open(cookies_path, "w", encoding="utf-8") as f:
         json.dump(cookies, f, ensure_ascii=False, indent=2)
 
 
+async def _block_heavy_resources(page) -> None:
+    cdp = await page.context.new_cdp_session(page)
+    await cdp.send("Network.enable")
+    await cdp.send("Network.setBlockedURLs", {"urls": _BLOCKED_URL_PATTERNS})
+
+
+# Browser-extension exports use Chrome's extension API values ("no_restriction",
+# "unspecified", null); Playwright accepts only Strict/Lax/None. Unknown values are
+# dropped so the browser applies its default.
+_COOKIE_SAME_SITE = {"strict": "Strict", "lax": "Lax", "none": "None", "no_restriction": "None"}
+
+
+def _normalize_cookie(c: Dict) -> Dict:
+    """Convert an exported cookie to the fields ``BrowserContext.add_cookies`` accepts."""
+    normalized = {k: c[k] for k in ("name", "value", "httpOnly", "secure") if k in c}
+    if c.get("url"):
+        # Playwright rejects url together with domain/path.
+        normalized["url"] = c["url"]
+    else:
+        normalized["domain"] = c.get("domain") or ".facebook.com"
+        normalized["path"] = c.get("path") or "/"
+    expires = c.get("expires", c.get("expirationDate"))
+    if isinstance(expires, (int, float)) and not isinstance(expires, bool):
+        normalized["expires"] = expires
+    same_site = c.get("sameSite")
+    if isinstance(same_site, str) and same_site.lower() in _COOKIE_SAME_SITE:
+        normalized["sameSite"] = _COOKIE_SAME_SITE[same_site.lower()]
+    return normalized
+
+
+def _warn(message: str) -> None:
+    print(f"warning: {message}", file=sys.stderr)
+
+
+async def _add_cookies_from_file(ctx, cookies_path: Optional[str]) -> None:
+    if not cookies_path or not os.path.exists(cookies_path):
+        return
+    try:
+        cookies = [_normalize_cookie(c) for c in _load_cookies_from_file(cookies_path) if isinstance(c, dict)]
+    except (OSError, ValueError) as exc:
+        _warn(f"could not read cookies from {cookies_path}: {exc}")
+        return
+    try:
+        # One add_cookies call sets the whole jar in a single protocol round-trip.
+        await ctx.add_cookies(cookies)
+    except PlaywrightError:
+        # Fall back to one call per cookie so a bad entry only costs itself.
+        for cookie in cookies:
+            try:
+                await ctx.add_cookies([cookie])
+            except PlaywrightError as exc:
+                _warn(f"skipped cookie {cookie.get('name')!r} from {cookies_path}: {exc.message}")
+
+
 async def _create_browser_page(
     *,
     headless: bool,
     slow_mo_ms: int,
     cookies_path: Optional[str],
+    user_data_dir: Optional[str] = None,
     user_agent: Optional[str] = None,
 ):
-    browser = await launch(
-        headless=headless,
-        args=[
-            "--no-sandbox",
-            "--disable-setuid-sandbox",
-            "--disable-dev-shm-usage",
-        ],
-        slowMo=slow_mo_ms,
-        handleSIGINT=False,
-        handleSIGTERM=False,
-        handleSIGHUP=False,
-    )
-    page = await browser.newPage()
-    await page.setUserAgent(user_agent or _default_user_agent())
-    await page.setViewport({"width": 1366, "height": 900})
-    if cookies_path and os.path.exists(cookies_path):
-        try:
-            cookies = _load_cookies_from_file(cookies_path)
-            normalized = []
-            for c in cookies:
-                c = {**c}
-                if "sameSite" in c and isinstance(c["sameSite"], str):
-                    c["sameSite"] = c["sameSite"].capitalize()
-                if not c.get("domain") and not c.get("url"):
-                    c["domain"] = ".facebook.com"
-                normalized.append(c)
-            for c in normalized:
-                await page.setCookie(c)
-        except Exception:
-            pass
-    return browser, page
+    """Open a page and return ``(ctx, page)``.
+
+    ``ctx`` is the context the caller owns and must close, or None when the page
+    lives in the shared persistent profile context.
+    """
+    user_agent = user_agent or _default_user_agent()
+    viewport = {"width": 1366, "height": 900}
+    if user_data_dir:
+        # A stored profile already carries the session; the cookies file seeds a new one
+        # and is re-applied by _ensure_logged_in if that session has expired.
+        shared = await get_persistent_context(
+            user_data_dir,
+            headless=headless,
+            slow_mo_ms=slow_mo_ms,
+            user_agent=user_agent,
+            viewport=viewport,
+            on_new_profile=lambda c: _add_cookies_from_file(c, cookies_path),
+        )
+        ctx = None
+        page = await shared.new_page()
+    else:
+        browser = await get_browser(headless=headless, slow_mo_ms=slow_mo_ms)
+        ctx = await browser.new_context(user_agent=user_agent, viewport=viewport)
+        await _add_cookies_from_file(ctx, cookies_path)
+        page = await ctx.new_page()
+    await _block_heavy_resources(page)
+    return ctx, page
 
 
 async def _is_login_page(page) -> bool:
-    url = page.url or ""
-    if "login" in url:
-        return True
+    # Only the path counts: search URLs carry the user's query and redirect targets
+    # (e.g. ?next=...), either of which can contain "login" on a logged-in page.
     try:
-        el = await page.querySelector('input[name="email"]')
-        return bool(el)
-    except Exception:
-        return False
+        return await page.evaluate(
+            "() => location.pathname.startsWith('/login')"
+            " || !!document.querySelector('input[name=\"email\"]')"
+        )
+    except PlaywrightError:
+        # The document went away mid-evaluate (e.g. a redirect); judge by URL alone.
+        return urlparse(page.url or "").path.startswith("/login")
 
 
-async def _ensure_logged_in(page) -> None:
-    await page.goto(FACEBOOK_MARKETPLACE_HOME, waitUntil="domcontentloaded")
+async def _reach_marketplace_home(page) -> bool:
+    await page.goto(FACEBOOK_MARKETPLACE_HOME, wait_until="domcontentloaded")
     for _ in range(3):
         if not await _is_login_page(page):
-            return
-        await asyncio.sleep(1.0)
-    if await _is_login_page(page):
+            return True
+        try:
+            await page.wait_for_event("framenavigated", lambda frame: frame == page.main_frame, timeout=2000)
+        except PlaywrightError:
+            pass
+    return not await _is_login_page(page)
+
+
+async def _ensure_logged_in(page, search_url: str, refresh_cookies_path: Optional[str] = None) -> None:
+    """Leave ``page`` on ``search_url``, going through the Marketplace home only if needed.
+
+    If the session is not logged in, cookies from ``refresh_cookies_path`` are added to
+    the page's context and login is retried once before giving up.
+    """
+    await page.goto(search_url, wait_until="domcontentloaded")
+    if not await _is_login_page(page):
+        return
+    logged_in = await _reach_marketplace_home(page)
+    if not logged_in and refresh_cookies_path and os.path.exists(refresh_cookies_path):
+        await _add_cookies_from_file(page.context, refresh_cookies_path)
+        logged_in = await _reach_marketplace_home(page)
+    if not logged_in:
         raise RuntimeError(
             "Facebook requires login to view Marketplace. Provide cookies file exported from a logged-in browser."
         )
+    await page.goto(search_url, wait_until="domcontentloaded")
 
 
 def _build_search_url(query: str) -> str:
@@ -129,71 +226,125 @@ def _build_search_url(query: str) -> str:
     return FACEBOOK_MARKETPLACE_SEARCH.format(query=quote(query))
 
 
-def _unique_by_item_id(listings: Iterable[Listing]) -> List[Listing]:
-    seen: Set[str] = set()
-    unique: List[Listing] = []
-    for l in listings:
-        if l.item_id in seen:
-            continue
-        seen.add(l.item_id)
-        unique.append(l)
-    return unique
-
-
-def _parse_anchor_map(record: Dict) -> Optional[Listing]:
-    try:
-        href = record.get("href") or ""
-        if "/marketplace/item/" not in href:
-            return None
-        item_id = _extract_item_id_from_url(href)
-        if not item_id:
-            return None
-        text_lines = [t.strip() for t in (record.get("text") or "").split("\n") if t.strip()]
-        title = text_lines[0] if text_lines else ""
-        price_text = ""
-        for t in text_lines[1:3]:
-            if any(s in t for s in ["$", "€", "£", "CAD", "AUD", "₹", "Price"]):
-                price_text = t
-                break
-        return Listing(
-            item_id=item_id,
-            url=href,
-            title=title,
-            price_text=price_text,
-            location_text="",
-            image_url=record.get("img") or "",
-            scraped_at=_now_iso(),
-        )
-    except Exception:
+def _parse_anchor_map(record: Dict, query: str, now_iso: str) -> Optional[Listing]:
+    href = record.get("href")
+    if not isinstance(href, str):
         return None
+    item_id = _extract_item_id_from_url(href)
+    if item_id is None:
+        return None
+    text = record.get("text")
+    # Only the title and the two lines after it are inspected.
+    text_lines: List[str] = []
+    if isinstance(text, str):
+        for t in text.split("\n"):
+            t = t.strip()
+            if t:
+                text_lines.append(t)
+                if len(text_lines) == 3:
+                    break
+    title = text_lines[0] if text_lines else ""
+    price_text = ""
+    for t in text_lines[1:]:
+        if any(s in t for s in _PRICE_TOKENS):
+            price_text = t
+            break
+    img = record.get("img")
+    return Listing(
+        item_id=item_id,
+        url=href,
+        title=title,
+        price_text=price_text,
+        location_text="",
+        image_url=img if isinstance(img, str) else "",
+        scraped_at=now_iso,
+        query=query,
+    )
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_fixed(2))
-async def _scroll_once(page) -> None:
-    await page.evaluate(
-        "() => new Promise(resolve => { window.scrollBy(0, document.body.scrollHeight); setTimeout(resolve, 800); })"
-    )
+_LISTING_ANCHOR_COUNT_JS = "document.querySelectorAll('a[href*=\"/marketplace/item/\"]').length"
 
 
-async def _collect_listings_from_page(page) -> List[Listing]:
-    records: List[Dict] = await page.evaluate(
-        """
-        () => Array.from(document.querySelectorAll('a[href*="/marketplace/item/"]')).map(a => ({
-            href: a.href,
-            text: a.innerText || '',
-            img: (a.querySelector('img') || {}).src || ''
-        }))
-        """
-    )
+async def _scroll_once(page, timeout_ms: int = 1500) -> None:
+    """Scroll to the bottom and wait until more listing anchors render, or ``timeout_ms``.
+
+    Failures are not retried here: a scroll that reveals nothing counts against the
+    caller's no-growth budget like any other.
+    """
+    try:
+        before = await page.evaluate(
+            f"() => {{ const n = {_LISTING_ANCHOR_COUNT_JS}; window.scrollBy(0, document.body.scrollHeight); return n; }}"
+        )
+        await page.wait_for_function(f"(before) => {_LISTING_ANCHOR_COUNT_JS} > before", arg=before, timeout=timeout_ms)
+    except PlaywrightError:
+        pass
+
+
+# Installs (once per document) a MutationObserver that buffers each listing anchor
+# the first time it appears, then drains the buffer. Only new anchors cross CDP, and
+# anchors whose text contains none of the lower-cased ``needles`` are dropped in-page
+# (only counted, so the caller still sees that the page grew).
+_HARVEST_NEW_ANCHORS_JS = """
+(needles) => {
+    if (!window.__carSalesBuf) {
+        const selector = 'a[href*="/marketplace/item/"]';
+        const seen = new Set();
+        window.__carSalesBuf = [];
+        window.__carSalesRejected = 0;
+        const take = a => {
+            const m = a.href.match(/\\/marketplace\\/item\\/(\\d+)/);
+            if (!m || seen.has(m[1])) return;
+            seen.add(m[1]);
+            const text = a.innerText || '';
+            if (needles.length) {
+                const lower = text.toLowerCase();
+                if (!needles.some(n => lower.includes(n))) {
+                    window.__carSalesRejected++;
+                    return;
+                }
+            }
+            window.__carSalesBuf.push({
+                href: a.href,
+                text: text,
+                img: (a.querySelector('img') || {}).src || ''
+            });
+        };
+        const harvest = root => {
+            if (root.matches && root.matches(selector)) take(root);
+            root.querySelectorAll(selector).forEach(take);
+        };
+        harvest(document);
+        new MutationObserver(muts => muts.forEach(m => m.addedNodes.forEach(n => {
+            if (n.nodeType === 1) harvest(n);
+        }))).observe(document.body, { childList: true, subtree: true });
+    }
+    const drained = { records: window.__carSalesBuf, rejected: window.__carSalesRejected };
+    window.__carSalesBuf = [];
+    window.__carSalesRejected = 0;
+    return drained;
+}
+"""
+
+
+async def _collect_listings_from_page(
+    page, query: str, location_contains: Optional[List[str]] = None
+) -> Tuple[List[Listing], int]:
+    """Return listings for anchors that appeared since the previous call.
+
+    Also returns how many new anchors were dropped by the ``location_contains`` filter.
+    """
+    needles = [n.lower() for n in (location_contains or []) if n]
+    drained: Dict = await page.evaluate(_HARVEST_NEW_ANCHORS_JS, needles)
+    now_iso = _now_iso()
     results: List[Listing] = []
-    for rec in records:
-        listing = _parse_anchor_map(rec)
+    for rec in drained["records"]:
+        listing = _parse_anchor_map(rec, query, now_iso)
         if listing is not None:
             results.append(listing)
-    return results
+    return results, drained["rejected"]
 
 
-async def scrape_marketplace_cars_async(
+async def iter_marketplace_cars(
     *,
     query: str,
     max_items: int = 50,
@@ -201,29 +352,52 @@ async def scrape_marketplace_cars_async(
     headless: bool = True,
     slow_mo_ms: int = 0,
     save_cookies_to: Optional[str] = None,
-) -> List[Dict]:
-    browser = None
+    user_data_dir: Optional[str] = DEFAULT_USER_DATA_DIR,
+    location_contains: Optional[List[str]] = None,
+) -> AsyncIterator[Listing]:
+    """Yield listings for ``query`` as each scroll reveals them, up to ``max_items``.
+
+    With ``location_contains``, only listings whose card text contains one of the
+    substrings (case-insensitive) are kept; the filter runs inside the page.
+
+    The shared browser stays open for later calls; await ``close_browser()`` when done.
+    """
+    ctx = None
     page = None
     try:
-        browser, page = await _create_browser_page(
-            headless=headless, slow_mo_ms=slow_mo_ms, cookies_path=cookies_path
+        ctx, page = await _create_browser_page(
+            headless=headless,
+            slow_mo_ms=slow_mo_ms,
+            cookies_path=cookies_path,
+            user_data_dir=user_data_dir,
         )
 
-        await _ensure_logged_in(page)
-
-        search_url = _build_search_url(query)
-        await page.goto(search_url, waitUntil="domcontentloaded")
+        # A stored profile may hold an expired session that the cookies file was never
+        # applied to; ephemeral contexts already carry the file's cookies.
+        await _ensure_logged_in(
+            page, _build_search_url(query), refresh_cookies_path=cookies_path if ctx is None else None
+        )
 
-        collected: List[Listing] = []
+        # The in-page buffer is reset if the document is replaced, so keep our own record too.
+        seen: Set[str] = set()
+        count = 0
         attempts_without_growth = 0
-        while len(collected) < max_items and attempts_without_growth < 8:
-            current = await _collect_listings_from_page(page)
-            before = len(collected)
-            collected = _unique_by_item_id([*collected, *current])
-            after = len(collected)
-            if after >= max_items:
+        while count < max_items and attempts_without_growth < 8:
+            current, rejected = await _collect_listings_from_page(page, query, location_contains)
+            new = 0
+            for listing in current:
+                item_id = listing["item_id"]
+                if item_id in seen:
+                    continue
+                seen.add(item_id)
+                new += 1
+                yield listing
+                count += 1
+                if count >= max_items:
+                    break
+            if count >= max_items:
                 break
-            if after == before:
+            if new == 0 and rejected == 0:
                 attempts_without_growth += 1
             else:
                 attempts_without_growth = 0
@@ -234,9 +408,6 @@ async def scrape_marketplace_cars_async(
                 await _save_cookies_to_file(page, save_cookies_to)
             except Exception:
                 pass
-
-        limited = collected[:max_items]
-        return [asdict(l) for l in limited]
     finally:
         try:
             if page is not None:
@@ -244,12 +415,39 @@ async def scrape_marketplace_cars_async(
         except Exception:
             pass
         try:
-            if browser is not None:
-                await browser.close()
+            if ctx is not None:
+                await ctx.close()
         except Exception:
             pass
 
 
+async def scrape_marketplace_cars_async(
+    *,
+    query: str,
+    max_items: int = 50,
+    cookies_path: Optional[str] = None,
+    headless: bool = True,
+    slow_mo_ms: int = 0,
+    save_cookies_to: Optional[str] = None,
+    user_data_dir: Optional[str] = DEFAULT_USER_DATA_DIR,
+    location_contains: Optional[List[str]] = None,
+) -> List[Listing]:
+    """List form of ``iter_marketplace_cars``; await ``close_browser()`` when done."""
+    return [
+        l
+        async for l in iter_marketplace_cars(
+            query=query,
+            max_items=max_items,
+            cookies_path=cookies_path,
+            headless=headless,
+            slow_mo_ms=slow_mo_ms,
+            save_cookies_to=save_cookies_to,
+            user_data_dir=user_data_dir,
+            location_contains=location_contains,
+        )
+    ]
+
+
 def scrape_marketplace_cars(
     *,
     query: str,
@@ -258,14 +456,193 @@ def scrape_marketplace_cars(
     headless: bool = True,
     slow_mo_ms: int = 0,
     save_cookies_to: Optional[str] = None,
-) -> List[Dict]:
-    return asyncio.run(
-        scrape_marketplace_cars_async(
+    user_data_dir: Optional[str] = DEFAULT_USER_DATA_DIR,
+    location_contains: Optional[List[str]] = None,
+) -> List[Listing]:
+    async def _run() -> List[Listing]:
+        try:
+            return await scrape_marketplace_cars_async(
+                query=query,
+                max_items=max_items,
+                cookies_path=cookies_path,
+                headless=headless,
+                slow_mo_ms=slow_mo_ms,
+                save_cookies_to=save_cookies_to,
+                user_data_dir=user_data_dir,
+                location_contains=location_contains,
+            )
+        finally:
+            await close_browser()
+
+    return asyncio.run(_run())
+
+
+async def scrape_marketplace_cars_many_async(
+    *,
+    queries: List[str],
+    max_concurrency: int = 5,
+    max_items: int = 50,
+    cookies_path: Optional[str] = None,
+    headless: bool = True,
+    slow_mo_ms: int = 0,
+    save_cookies_to: Optional[str] = None,
+    user_data_dir: Optional[str] = DEFAULT_USER_DATA_DIR,
+    location_contains: Optional[List[str]] = None,
+    on_error: Optional[Callable[[str, Exception], None]] = None,
+) -> List[List[Listing]]:
+    """One listing list per query, in input order; await ``close_browser()`` when done.
+
+    A query that fails is passed to ``on_error(query, exc)`` and gets an empty list;
+    without ``on_error`` the first failure is raised once the other queries are cancelled.
+    """
+
+    async def _one(query: str) -> List[Listing]:
+        return await scrape_marketplace_cars_async(
             query=query,
             max_items=max_items,
             cookies_path=cookies_path,
             headless=headless,
             slow_mo_ms=slow_mo_ms,
             save_cookies_to=save_cookies_to,
+            user_data_dir=user_data_dir,
+            location_contains=location_contains,
         )
+
+    results = await Cluster(max_concurrency).map(_one, queries, on_error=on_error)
+    return [rows if rows is not None else [] for rows in results]
+
+
+def scrape_marketplace_cars_many(
+    *,
+    queries: List[str],
+    max_concurrency: int = 5,
+    max_items: int = 50,
+    cookies_path: Optional[str] = None,
+    headless: bool = True,
+    slow_mo_ms: int = 0,
+    save_cookies_to: Optional[str] = None,
+    user_data_dir: Optional[str] = DEFAULT_USER_DATA_DIR,
+    location_contains: Optional[List[str]] = None,
+    on_error: Optional[Callable[[str, Exception], None]] = None,
+) -> List[List[Listing]]:
+    async def _run() -> List[List[Listing]]:
+        try:
+            return await scrape_marketplace_cars_many_async(
+                queries=queries,
+                max_concurrency=max_concurrency,
+                max_items=max_items,
+                cookies_path=cookies_path,
+                headless=headless,
+                slow_mo_ms=slow_mo_ms,
+                save_cookies_to=save_cookies_to,
+                user_data_dir=user_data_dir,
+                location_contains=location_contains,
+                on_error=on_error,
+            )
+        finally:
+            await close_browser()
+
+    return asyncio.run(_run())
+
+
+async def iter_marketplace_cars_many(
+    *,
+    queries: List[str],
+    max_concurrency: int = 5,
+    max_items: int = 50,
+    cookies_path: Optional[str] = None,
+    headless: bool = True,
+    slow_mo_ms: int = 0,
+    save_cookies_to: Optional[str] = None,
+    user_data_dir: Optional[str] = DEFAULT_USER_DATA_DIR,
+    location_contains: Optional[List[str]] = None,
+    on_error: Optional[Callable[[str, Exception], None]] = None,
+    on_idle: Optional[Callable[[], None]] = None,
+) -> AsyncIterator[Listing]:
+    """Yield listings from all ``queries`` in arrival order, interleaved across queries.
+
+    A query that fails is passed to ``on_error(query, exc)`` while the others carry on;
+    without ``on_error`` the first failure is raised. ``on_idle()`` runs each time the
+    listings revealed so far (typically one scroll tick's worth) have all been yielded.
+    """
+
+    def _one(query: str) -> AsyncIterator[Listing]:
+        return iter_marketplace_cars(
+            query=query,
+            max_items=max_items,
+            cookies_path=cookies_path,
+            headless=headless,
+            slow_mo_ms=slow_mo_ms,
+            save_cookies_to=save_cookies_to,
+            user_data_dir=user_data_dir,
+            location_contains=location_contains,
+        )
+
+    listings = Cluster(max_concurrency).stream(_one, queries, on_error=on_error, on_idle=on_idle)
+    try:
+        async for listing in listings:
+            yield listing
+    finally:
+        await listings.aclose()
+
+
+async def _next_listing(listings: AsyncIterator[Listing]) -> Listing:
+    return await listings.__anext__()
+
+
+def stream_marketplace_cars_many(
+    *,
+    queries: List[str],
+    max_concurrency: int = 5,
+    max_items: int = 50,
+    cookies_path: Optional[str] = None,
+    headless: bool = True,
+    slow_mo_ms: int = 0,
+    save_cookies_to: Optional[str] = None,
+    user_data_dir: Optional[str] = DEFAULT_USER_DATA_DIR,
+    location_contains: Optional[List[str]] = None,
+    on_error: Optional[Callable[[str, Exception], None]] = None,
+    on_idle: Optional[Callable[[], None]] = None,
+) -> Iterator[Listing]:
+    """Synchronous counterpart of ``iter_marketplace_cars_many``."""
+    loop = asyncio.new_event_loop()
+    listings = iter_marketplace_cars_many(
+        queries=queries,
+        max_concurrency=max_concurrency,
+        max_items=max_items,
+        cookies_path=cookies_path,
+        headless=headless,
+        slow_mo_ms=slow_mo_ms,
+        save_cookies_to=save_cookies_to,
+        user_data_dir=user_data_dir,
+        location_contains=location_contains,
+        on_error=on_error,
+        on_idle=on_idle,
     )
+    step: Optional[asyncio.Task] = None
+    try:
+        while True:
+            step = loop.create_task(_next_listing(listings))
+            try:
+                listing = loop.run_until_complete(step)
+            except StopAsyncIteration:
+                return
+            yield listing
+    finally:
+        # An interrupt (e.g. Ctrl+C) can leave ``step`` suspended inside the generator;
+        # cancel it first, since aclose() refuses a generator that is still running.
+        # Cleanup errors are swallowed so the original exception propagates.
+        try:
+            if step is not None and not step.done():
+                step.cancel()
+                try:
+                    loop.run_until_complete(asyncio.gather(step, return_exceptions=True))
+                except Exception:
+                    pass
+            for cleanup in (listings.aclose, close_browser, loop.shutdown_asyncgens):
+                try:
+                    loop.run_until_complete(cleanup())
+                except Exception:
+                    pass
+        finally:
+            loop.close()